@@ -9,7 +9,6 @@ from uvrl.app.services.config_apply import apply_config_variant
 from uvrl.app.services.config_backups import print_config_backups, restore_config_from_backup
 from uvrl.app.services.config_locations import add_config_location, print_config_locations
 from uvrl.app.services.profile_validation import print_profile_validation
-from uvrl.app.services.profile_runner import run_profile
 from uvrl.app.services.config_variants import (
     create_working_variant_from_original,
     delete_config_variant,
@@ -18,7 +17,6 @@ from uvrl.app.services.config_variants import (
 )
 from uvrl.app.services.database import initialize_database, print_database_status
 from uvrl.app.services.discovery_catalog import print_discovery_catalog
-from uvrl.app.services.scanner import run_scan_wizard
 from uvrl.app.services.reset import print_reset_proof, reset_uvrl_runtime_state
 from uvrl.app.services.profiles import (
     add_delay_step,
@@ -89,10 +87,26 @@ def build_parser() -> argparse.ArgumentParser:
         help="List known app/config discovery targets.",
     )
 
-    subparsers.add_parser(
+    scan_wizard_parser = subparsers.add_parser(
         "scan-wizard",
         help="Interactively scan for catalog-matched executables and config files.",
     )
+    scan_wizard_output_group = scan_wizard_parser.add_mutually_exclusive_group()
+    scan_wizard_output_group.add_argument(
+        "--show-status",
+        action="store_true",
+        help="Print every directory search status instead of a one-line summary.",
+    )
+    scan_wizard_output_group.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Only print prompts and matched results, without progress or status lines.",
+    )
+    scan_wizard_parser.add_argument(
+        "--rescan",
+        action="store_true",
+        help="Walk every directory again instead of reusing unchanged cached results.",
+    )
 
     reset_parser = subparsers.add_parser(
         "reset-uvrl",
@@ -348,7 +362,13 @@ def main() -> None:
         print_discovery_catalog()
 
     elif args.command == "scan-wizard":
-        run_scan_wizard()
+        from uvrl.app.services.scanner import run_scan_wizard
+
+        run_scan_wizard(
+            show_statuses=args.show_status,
+            use_cache=not args.rescan,
+            quiet=args.quiet,
+        )
 
     elif args.command == "reset-uvrl":
         if not args.yes:
@@ -359,25 +379,26 @@ def main() -> None:
 
         result = reset_uvrl_runtime_state(create_backup=not args.no_backup)
 
-        print("UVRL reset complete.")
-        print(f"  database: {result.database_path}")
+        lines = [
+            "UVRL reset complete.",
+            f"  database: {result.database_path}",
+        ]
 
         if result.backup_path is not None:
-            print(f"  backup:   {result.backup_path}")
+            lines.append(f"  backup:   {result.backup_path}")
         else:
-            print("  backup:   not created")
+            lines.append("  backup:   not created")
 
         if result.deleted_directories:
-            print("  deleted generated directories:")
-
-            for directory in result.deleted_directories:
-                print(f"    - {directory}")
+            lines.append("  deleted generated directories:")
+            lines.extend(f"    - {directory}" for directory in result.deleted_directories)
 
         if result.recreated_directories:
-            print("  recreated runtime directories:")
+            lines.append("  recreated runtime directories:")
+            lines.extend(f"    - {directory}" for directory in result.recreated_directories)
+
+        print("\n".join(lines))
 
-            for directory in result.recreated_directories:
-                print(f"    - {directory}")
         if args.proof:
             print_reset_proof()
 
@@ -554,6 +575,8 @@ def main() -> None:
         print_profile_validation(args.profile_id)
 
     elif args.command == "profile-run":
+        from uvrl.app.services.profile_runner import run_profile
+
         run_profile(
             profile_id=args.profile_id,
             dry_run=args.dry_run,
@@ -657,4 +680,9 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    except KeyboardInterrupt:
+        print()
+        print("Cancelled.")
+        raise SystemExit(130)
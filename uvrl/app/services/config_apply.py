@@ -1,13 +1,21 @@
 from __future__ import annotations
 
-import hashlib
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from pathlib import Path
 
+from uvrl.app.services.config_backups import find_matching_backup_for_location
+from uvrl.app.services.config_storage import (
+    extension_from_path,
+    relative_to_project,
+    resolve_export_dir,
+    sha256_bytes,
+    split_content_for_sql,
+    stored_path_to_absolute,
+    utc_timestamp_for_filename,
+    write_export_file,
+)
 from uvrl.app.services.database import (
     CONFIG_BACKUPS_DIR,
-    PROJECT_ROOT,
     ensure_runtime_directories,
     open_database,
 )
@@ -28,71 +36,6 @@ class ApplyConfigVariantResult:
     matched_existing_backup_id: int | None
 
 
-def _sha256_bytes(content: bytes) -> str:
-    return hashlib.sha256(content).hexdigest()
-
-
-def _utc_timestamp_for_filename() -> str:
-    return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-
-
-def _relative_to_project(path: Path) -> str:
-    try:
-        return str(path.relative_to(PROJECT_ROOT))
-    except ValueError:
-        return str(path)
-
-
-def _resolve_export_dir(path_text: str | None, default_path: Path) -> Path:
-    if path_text is None:
-        return default_path
-
-    path = Path(path_text).expanduser()
-
-    if not path.is_absolute():
-        path = PROJECT_ROOT / path
-
-    return path.resolve()
-
-
-def _stored_path_to_absolute(path_text: str | None) -> Path | None:
-    if not path_text:
-        return None
-
-    path = Path(path_text).expanduser()
-
-    if not path.is_absolute():
-        path = PROJECT_ROOT / path
-
-    return path.resolve()
-
-
-def _is_under_directory(path_text: str | None, directory: Path) -> bool:
-    stored_path = _stored_path_to_absolute(path_text)
-
-    if stored_path is None:
-        return False
-
-    directory = directory.resolve()
-
-    try:
-        stored_path.relative_to(directory)
-        return True
-    except ValueError:
-        return False
-
-
-def _extension_from_path(path: Path) -> str:
-    return path.suffix if path.suffix else ".config"
-
-
-def _split_content_for_sql(content: bytes) -> tuple[str | None, bytes | None, str]:
-    try:
-        return content.decode("utf-8"), None, "utf-8"
-    except UnicodeDecodeError:
-        return None, content, "binary"
-
-
 def _content_from_variant_row(row) -> bytes:
     if row["content_blob"] is not None:
         return bytes(row["content_blob"])
@@ -104,7 +47,7 @@ def _content_from_variant_row(row) -> bytes:
     exported_file_path = row["exported_file_path"]
 
     if exported_file_path:
-        exported_path = _stored_path_to_absolute(exported_file_path)
+        exported_path = stored_path_to_absolute(exported_file_path)
 
         if exported_path is None:
             raise ValueError("Variant exported file path could not be resolved.")
@@ -114,44 +57,6 @@ def _content_from_variant_row(row) -> bytes:
     raise ValueError("Variant has no stored content and no exported file path.")
 
 
-def _write_export_file(path: Path, content: bytes) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_bytes(content)
-
-
-def _find_matching_backup_for_location(
-    config_location_id: int,
-    content_sha256: str,
-    target_backup_dir: Path,
-    backup_export_dir_was_provided: bool,
-) -> int | None:
-    with open_database() as database:
-        rows = database.execute(
-            """
-            SELECT
-                config_backup_id,
-                exported_file_path
-            FROM config_backups
-            WHERE config_location_id = ?
-              AND content_sha256 = ?
-            ORDER BY config_backup_id;
-            """,
-            (config_location_id, content_sha256),
-        ).fetchall()
-
-    if not rows:
-        return None
-
-    if not backup_export_dir_was_provided:
-        return int(rows[0]["config_backup_id"])
-
-    for row in rows:
-        if _is_under_directory(row["exported_file_path"], target_backup_dir):
-            return int(row["config_backup_id"])
-
-    return None
-
-
 def apply_config_variant(
     config_variant_id: int,
     backup_export_dir: str | None = None,
@@ -170,7 +75,7 @@ def apply_config_variant(
     ensure_runtime_directories()
 
     backup_export_dir_was_provided = backup_export_dir is not None
-    backup_base_dir = _resolve_export_dir(backup_export_dir, CONFIG_BACKUPS_DIR)
+    backup_base_dir = resolve_export_dir(backup_export_dir, CONFIG_BACKUPS_DIR)
 
     with open_database() as database:
         variant = database.execute(
@@ -201,14 +106,14 @@ def apply_config_variant(
     variant_name = str(variant["variant_name"])
     target_path = Path(variant["file_path"]).expanduser()
     variant_content = _content_from_variant_row(variant)
-    variant_sha256 = _sha256_bytes(variant_content)
+    variant_sha256 = sha256_bytes(variant_content)
 
     if target_path.exists():
         current_content = target_path.read_bytes()
     else:
         current_content = b""
 
-    current_sha256 = _sha256_bytes(current_content)
+    current_sha256 = sha256_bytes(current_content)
 
     if target_path.exists() and current_sha256 == variant_sha256:
         return ApplyConfigVariantResult(
@@ -223,7 +128,7 @@ def apply_config_variant(
             matched_existing_backup_id=None,
         )
 
-    current_text, current_blob, current_encoding = _split_content_for_sql(current_content)
+    current_text, current_blob, current_encoding = split_content_for_sql(current_content)
 
     matched_existing_backup_id = None
     backup_created = False
@@ -231,7 +136,7 @@ def apply_config_variant(
     backup_export_path: str | None = None
 
     if target_path.exists():
-        matched_existing_backup_id = _find_matching_backup_for_location(
+        matched_existing_backup_id = find_matching_backup_for_location(
             config_location_id=config_location_id,
             content_sha256=current_sha256,
             target_backup_dir=backup_base_dir,
@@ -270,16 +175,16 @@ def apply_config_variant(
 
             backup_id = int(cursor.lastrowid)
 
-            timestamp = _utc_timestamp_for_filename()
-            extension = _extension_from_path(target_path)
+            timestamp = utc_timestamp_for_filename()
+            extension = extension_from_path(target_path)
             backup_file = (
                 backup_base_dir
                 / str(config_location_id)
                 / f"{backup_id}_{timestamp}_before_variant_apply_{current_sha256[:12]}{extension}"
             )
 
-            _write_export_file(backup_file, current_content)
-            backup_export_path = _relative_to_project(backup_file)
+            write_export_file(backup_file, current_content)
+            backup_export_path = relative_to_project(backup_file)
 
             database.execute(
                 """
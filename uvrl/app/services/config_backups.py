@@ -1,13 +1,21 @@
 from __future__ import annotations
 
-import hashlib
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from pathlib import Path
 
+from uvrl.app.services.config_storage import (
+    extension_from_path,
+    is_under_directory,
+    relative_to_project,
+    resolve_export_dir,
+    sha256_bytes,
+    split_content_for_sql,
+    stored_path_to_absolute,
+    utc_timestamp_for_filename,
+    write_export_file,
+)
 from uvrl.app.services.database import (
     CONFIG_BACKUPS_DIR,
-    PROJECT_ROOT,
     ensure_runtime_directories,
     open_database,
 )
@@ -25,71 +33,6 @@ class RestoreBackupResult:
     matched_existing_backup_id: int | None
 
 
-def _sha256_bytes(content: bytes) -> str:
-    return hashlib.sha256(content).hexdigest()
-
-
-def _utc_timestamp_for_filename() -> str:
-    return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-
-
-def _relative_to_project(path: Path) -> str:
-    try:
-        return str(path.relative_to(PROJECT_ROOT))
-    except ValueError:
-        return str(path)
-
-
-def _resolve_export_dir(path_text: str | None, default_path: Path) -> Path:
-    if path_text is None:
-        return default_path
-
-    path = Path(path_text).expanduser()
-
-    if not path.is_absolute():
-        path = PROJECT_ROOT / path
-
-    return path.resolve()
-
-
-def _stored_path_to_absolute(path_text: str | None) -> Path | None:
-    if not path_text:
-        return None
-
-    path = Path(path_text).expanduser()
-
-    if not path.is_absolute():
-        path = PROJECT_ROOT / path
-
-    return path.resolve()
-
-
-def _is_under_directory(path_text: str | None, directory: Path) -> bool:
-    stored_path = _stored_path_to_absolute(path_text)
-
-    if stored_path is None:
-        return False
-
-    directory = directory.resolve()
-
-    try:
-        stored_path.relative_to(directory)
-        return True
-    except ValueError:
-        return False
-
-
-def _extension_from_path(path: Path) -> str:
-    return path.suffix if path.suffix else ".config"
-
-
-def _split_content_for_sql(content: bytes) -> tuple[str | None, bytes | None, str]:
-    try:
-        return content.decode("utf-8"), None, "utf-8"
-    except UnicodeDecodeError:
-        return None, content, "binary"
-
-
 def _content_from_backup_row(row) -> bytes:
     if row["content_blob"] is not None:
         return bytes(row["content_blob"])
@@ -101,7 +44,7 @@ def _content_from_backup_row(row) -> bytes:
     exported_file_path = row["exported_file_path"]
 
     if exported_file_path:
-        exported_path = _stored_path_to_absolute(exported_file_path)
+        exported_path = stored_path_to_absolute(exported_file_path)
 
         if exported_path is None:
             raise ValueError("Backup exported file path could not be resolved.")
@@ -111,12 +54,7 @@ def _content_from_backup_row(row) -> bytes:
     raise ValueError("Backup has no stored content and no exported file path.")
 
 
-def _write_export_file(path: Path, content: bytes) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_bytes(content)
-
-
-def _find_matching_backup_for_location(
+def find_matching_backup_for_location(
     config_location_id: int,
     content_sha256: str,
     target_backup_dir: Path,
@@ -143,7 +81,7 @@ def _find_matching_backup_for_location(
         return int(rows[0]["config_backup_id"])
 
     for row in rows:
-        if _is_under_directory(row["exported_file_path"], target_backup_dir):
+        if is_under_directory(row["exported_file_path"], target_backup_dir):
             return int(row["config_backup_id"])
 
     return None
@@ -205,7 +143,7 @@ def restore_config_from_backup(
     ensure_runtime_directories()
 
     backup_export_dir_was_provided = backup_export_dir is not None
-    backup_base_dir = _resolve_export_dir(backup_export_dir, CONFIG_BACKUPS_DIR)
+    backup_base_dir = resolve_export_dir(backup_export_dir, CONFIG_BACKUPS_DIR)
 
     with open_database() as database:
         backup = database.execute(
@@ -242,10 +180,10 @@ def restore_config_from_backup(
     with open_database() as database:
         if create_pre_restore_backup and target_path.exists():
             current_content = target_path.read_bytes()
-            current_sha256 = _sha256_bytes(current_content)
-            current_text, current_blob, current_encoding = _split_content_for_sql(current_content)
+            current_sha256 = sha256_bytes(current_content)
+            current_text, current_blob, current_encoding = split_content_for_sql(current_content)
 
-            matched_existing_backup_id = _find_matching_backup_for_location(
+            matched_existing_backup_id = find_matching_backup_for_location(
                 config_location_id=config_location_id,
                 content_sha256=current_sha256,
                 target_backup_dir=backup_base_dir,
@@ -283,16 +221,16 @@ def restore_config_from_backup(
 
                 pre_restore_backup_id = int(cursor.lastrowid)
 
-                timestamp = _utc_timestamp_for_filename()
-                extension = _extension_from_path(target_path)
+                timestamp = utc_timestamp_for_filename()
+                extension = extension_from_path(target_path)
                 export_path = (
                     backup_base_dir
                     / str(config_location_id)
                     / f"{pre_restore_backup_id}_{timestamp}_before_restore_{current_sha256[:12]}{extension}"
                 )
 
-                _write_export_file(export_path, current_content)
-                pre_restore_backup_export_path = _relative_to_project(export_path)
+                write_export_file(export_path, current_content)
+                pre_restore_backup_export_path = relative_to_project(export_path)
 
                 database.execute(
                     """
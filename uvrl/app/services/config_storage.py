@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime, timezone
+from pathlib import Path
+
+from uvrl.app.services.database import PROJECT_ROOT
+
+
+def sha256_bytes(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def utc_timestamp_for_filename() -> str:
+    return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def relative_to_project(path: Path) -> str:
+    try:
+        return str(path.relative_to(PROJECT_ROOT))
+    except ValueError:
+        return str(path)
+
+
+def resolve_export_dir(path_text: str | None, default_path: Path) -> Path:
+    if path_text is None:
+        return default_path
+
+    path = Path(path_text).expanduser()
+
+    if not path.is_absolute():
+        path = PROJECT_ROOT / path
+
+    return path.resolve()
+
+
+def stored_path_to_absolute(path_text: str | None) -> Path | None:
+    if not path_text:
+        return None
+
+    path = Path(path_text).expanduser()
+
+    if not path.is_absolute():
+        path = PROJECT_ROOT / path
+
+    return path.resolve()
+
+
+def is_under_directory(path_text: str | None, directory: Path) -> bool:
+    stored_path = stored_path_to_absolute(path_text)
+
+    if stored_path is None:
+        return False
+
+    directory = directory.resolve()
+
+    try:
+        stored_path.relative_to(directory)
+        return True
+    except ValueError:
+        return False
+
+
+def extension_from_path(path: Path) -> str:
+    return path.suffix if path.suffix else ".config"
+
+
+def split_content_for_sql(content: bytes) -> tuple[str | None, bytes | None, str]:
+    try:
+        return content.decode("utf-8"), None, "utf-8"
+    except UnicodeDecodeError:
+        return None, content, "binary"
+
+
+def write_export_file(path: Path, content: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
@@ -1,15 +1,24 @@
 from __future__ import annotations
 
-import hashlib
 import os
 import re
 import shutil
 import subprocess
 import sys
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from pathlib import Path
 
+from uvrl.app.services.config_storage import (
+    extension_from_path,
+    is_under_directory,
+    relative_to_project,
+    resolve_export_dir,
+    sha256_bytes,
+    split_content_for_sql,
+    stored_path_to_absolute,
+    utc_timestamp_for_filename,
+    write_export_file,
+)
 from uvrl.app.services.database import (
     CONFIG_VARIANTS_DIR,
     PROJECT_ROOT,
@@ -40,14 +49,6 @@ class ConfigVariantWorkingCopyResult:
     opened_with_default_app: bool
 
 
-def _sha256_bytes(content: bytes) -> str:
-    return hashlib.sha256(content).hexdigest()
-
-
-def _utc_timestamp_for_filename() -> str:
-    return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-
-
 def _slugify(value: str) -> str:
     value = value.strip().lower()
     value = re.sub(r"[^a-z0-9]+", "_", value)
@@ -55,68 +56,6 @@ def _slugify(value: str) -> str:
     return value.strip("_") or "unnamed"
 
 
-def _relative_to_project(path: Path) -> str:
-    try:
-        return str(path.relative_to(PROJECT_ROOT))
-    except ValueError:
-        return str(path)
-
-
-def _resolve_export_dir(path_text: str | None, default_path: Path) -> Path:
-    if path_text is None:
-        return default_path
-
-    path = Path(path_text).expanduser()
-
-    if not path.is_absolute():
-        path = PROJECT_ROOT / path
-
-    return path.resolve()
-
-
-def _stored_path_to_absolute(path_text: str | None) -> Path | None:
-    if not path_text:
-        return None
-
-    path = Path(path_text).expanduser()
-
-    if not path.is_absolute():
-        path = PROJECT_ROOT / path
-
-    return path.resolve()
-
-
-def _is_under_directory(path_text: str | None, directory: Path) -> bool:
-    stored_path = _stored_path_to_absolute(path_text)
-
-    if stored_path is None:
-        return False
-
-    directory = directory.resolve()
-
-    try:
-        stored_path.relative_to(directory)
-        return True
-    except ValueError:
-        return False
-
-
-def _extension_from_path(path: Path) -> str:
-    return path.suffix if path.suffix else ".config"
-
-
-def _split_content_for_sql(content: bytes) -> tuple[str | None, bytes | None, str]:
-    try:
-        return content.decode("utf-8"), None, "utf-8"
-    except UnicodeDecodeError:
-        return None, content, "binary"
-
-
-def _write_export_file(path: Path, content: bytes) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_bytes(content)
-
-
 def _open_with_default_app(path: Path) -> bool:
     try:
         if sys.platform.startswith("win"):
@@ -214,7 +153,7 @@ def _find_matching_variant_for_location(
         )
 
     for row in rows:
-        if _is_under_directory(row["exported_file_path"], target_variant_dir):
+        if is_under_directory(row["exported_file_path"], target_variant_dir):
             return (
                 int(row["config_variant_id"]),
                 row["variant_name"],
@@ -242,7 +181,7 @@ def import_variant_from_file(
     ensure_runtime_directories()
 
     variant_export_dir_was_provided = variant_export_dir is not None
-    variant_base_dir = _resolve_export_dir(variant_export_dir, CONFIG_VARIANTS_DIR)
+    variant_base_dir = resolve_export_dir(variant_export_dir, CONFIG_VARIANTS_DIR)
 
     config_location = _find_config_location(
         config_location_id=config_location_id,
@@ -262,8 +201,8 @@ def import_variant_from_file(
         raise FileNotFoundError(f"Variant source file does not exist: {source_path}")
 
     content = source_path.read_bytes()
-    content_sha256 = _sha256_bytes(content)
-    content_text, content_blob, content_encoding = _split_content_for_sql(content)
+    content_sha256 = sha256_bytes(content)
+    content_text, content_blob, content_encoding = split_content_for_sql(content)
 
     matching_variant = _find_matching_variant_for_location(
         config_location_id=resolved_config_location_id,
@@ -284,7 +223,7 @@ def import_variant_from_file(
             matched_existing_variant_name=existing_name,
         )
 
-    extension = _extension_from_path(source_path)
+    extension = extension_from_path(source_path)
     variant_slug = _slugify(variant_name)
 
     with open_database() as database:
@@ -321,8 +260,8 @@ def import_variant_from_file(
             / f"{config_variant_id}_{variant_slug}_{content_sha256[:12]}{extension}"
         )
 
-        _write_export_file(variant_file, content)
-        variant_export_path = _relative_to_project(variant_file)
+        write_export_file(variant_file, content)
+        variant_export_path = relative_to_project(variant_file)
 
         database.execute(
             """
@@ -372,10 +311,10 @@ def create_working_variant_from_original(
     if not original_path.exists():
         raise FileNotFoundError(f"Original config file does not exist: {original_path}")
 
-    base_working_dir = _resolve_export_dir(working_dir, CONFIG_VARIANT_WORKING_DIR)
-    timestamp = _utc_timestamp_for_filename()
+    base_working_dir = resolve_export_dir(working_dir, CONFIG_VARIANT_WORKING_DIR)
+    timestamp = utc_timestamp_for_filename()
     variant_slug = _slugify(variant_name)
-    extension = _extension_from_path(original_path)
+    extension = extension_from_path(original_path)
 
     working_file = (
         base_working_dir
@@ -395,7 +334,7 @@ def create_working_variant_from_original(
         config_location_id=resolved_config_location_id,
         config_display_name=display_name,
         original_config_path=str(original_path),
-        working_file_path=_relative_to_project(working_file),
+        working_file_path=relative_to_project(working_file),
         opened_with_default_app=opened,
     )
 
@@ -474,7 +413,7 @@ def delete_config_variant(
         exported_file_missing = False
 
         if delete_exported_file and exported_file_path:
-            exported_path = _stored_path_to_absolute(exported_file_path)
+            exported_path = stored_path_to_absolute(exported_file_path)
 
             if exported_path is not None and exported_path.exists():
                 exported_path.unlink()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import csv
 import os
+import re
 import shlex
 import shutil
 import subprocess
@@ -17,6 +18,13 @@ from uvrl.app.services.profile_validation import validate_profile
 from uvrl.app.services.profiles import ProfileStep, list_profile_steps
 from dataclasses import dataclass
 
+INDENTED_DESKTOP_EXEC_LINE_PATTERN = re.compile(r"^\s*Exec=(.*)$", re.MULTILINE)
+
+IS_WINDOWS = sys.platform.startswith("win")
+IS_LINUX = sys.platform.startswith("linux")
+
+PROCESS_POLL_INTERVAL_SECONDS = 1.0
+
 @dataclass
 class LaunchArgumentContext:
     arguments: list[str]
@@ -26,21 +34,22 @@ def _split_args(argument_text: str | None) -> list[str]:
     if not argument_text:
         return []
 
-    return shlex.split(argument_text, posix=not sys.platform.startswith("win"))
+    return shlex.split(argument_text, posix=not IS_WINDOWS)
 
 def _read_desktop_exec_line(desktop_file_path: str) -> str:
     desktop_path = Path(desktop_file_path).expanduser()
 
-    if not desktop_path.exists():
-        raise FileNotFoundError(f"Desktop file does not exist: {desktop_path}")
+    try:
+        content = desktop_path.read_text(errors="ignore")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Desktop file does not exist: {desktop_path}") from None
 
-    for line in desktop_path.read_text(errors="ignore").splitlines():
-        stripped = line.strip()
+    match = INDENTED_DESKTOP_EXEC_LINE_PATTERN.search(content)
 
-        if stripped.startswith("Exec="):
-            return stripped.removeprefix("Exec=").strip()
+    if match is None:
+        raise ValueError(f"Desktop file has no Exec line: {desktop_path}")
 
-    raise ValueError(f"Desktop file has no Exec line: {desktop_path}")
+    return match.group(1).strip()
 
 
 def _apply_desktop_arguments(
@@ -100,8 +109,9 @@ def _apply_desktop_arguments(
 
 def _script_interpreter_from_shebang(script_path: Path) -> list[str] | None:
     try:
-        first_line = script_path.read_text(errors="ignore").splitlines()[0]
-    except (OSError, IndexError):
+        with script_path.open(errors="ignore") as script_file:
+            first_line = script_file.readline().rstrip("\n")
+    except OSError:
         return None
 
     if not first_line.startswith("#!"):
@@ -153,11 +163,11 @@ def _script_command(script_path_text: str, arguments: list[str]) -> list[str]:
         return ["fish", str(script_path), *arguments]
 
     if suffix == ".ps1":
-        shell_command = "powershell" if sys.platform.startswith("win") else "pwsh"
+        shell_command = "powershell" if IS_WINDOWS else "pwsh"
         return [shell_command, str(script_path), *arguments]
 
     if suffix in {".bat", ".cmd"}:
-        if not sys.platform.startswith("win"):
+        if not IS_WINDOWS:
             raise RuntimeError("Batch files are only supported on Windows.")
         return [str(script_path), *arguments]
 
@@ -166,7 +176,7 @@ def _script_command(script_path_text: str, arguments: list[str]) -> list[str]:
     if shebang_command:
         return [*shebang_command, str(script_path), *arguments]
 
-    if sys.platform.startswith("linux") and os.access(script_path, os.X_OK):
+    if IS_LINUX and os.access(script_path, os.X_OK):
         return [str(script_path), *arguments]
 
     raise ValueError(
@@ -194,7 +204,7 @@ def _app_output_log_path(display_name: str) -> Path:
 def _terminal_launcher_command(command: list[str], display_name: str) -> list[str] | None:
     title = f"UVRL - {display_name}"
 
-    if sys.platform.startswith("linux"):
+    if IS_LINUX:
         if shutil.which("ptyxis"):
             return ["ptyxis", "--new-window", "--title", title, "--", *command]
 
@@ -237,7 +247,7 @@ def _launch_command(
                 cwd=cwd,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
-                start_new_session=not sys.platform.startswith("win"),
+                start_new_session=not IS_WINDOWS,
             )
 
             print(f"  launched {display_name} in separate terminal: {command}")
@@ -258,7 +268,7 @@ def _launch_command(
             cwd=cwd,
             stdout=log_file,
             stderr=subprocess.STDOUT,
-            start_new_session=not sys.platform.startswith("win"),
+            start_new_session=not IS_WINDOWS,
         )
 
     print(f"  launched {display_name}: {command}")
@@ -393,14 +403,14 @@ def _launch_executable_step(
         if not executable_path:
             raise ValueError(f"PowerShell app [{step.app_id}] has no executable_path.")
 
-        shell_command = "powershell" if sys.platform.startswith("win") else "pwsh"
+        shell_command = "powershell" if IS_WINDOWS else "pwsh"
         command = [shell_command, str(Path(executable_path).expanduser()), *arguments]
 
     elif launch_kind == "batch":
         if not executable_path:
             raise ValueError(f"Batch app [{step.app_id}] has no executable_path.")
 
-        if not sys.platform.startswith("win"):
+        if not IS_WINDOWS:
             raise RuntimeError("Batch files are only supported on Windows.")
 
         command = [str(Path(executable_path).expanduser()), *arguments]
@@ -411,7 +421,7 @@ def _launch_executable_step(
 
         native_path = Path(executable_path).expanduser()
 
-        if sys.platform.startswith("linux") and native_path.suffix.lower() == ".desktop":
+        if IS_LINUX and native_path.suffix.lower() == ".desktop":
             exec_line = _read_desktop_exec_line(str(native_path))
             command = _apply_desktop_arguments(
                 exec_line=exec_line,
@@ -427,7 +437,7 @@ def _launch_executable_step(
 
         custom_path = Path(executable_path).expanduser()
 
-        if sys.platform.startswith("linux") and custom_path.suffix.lower() == ".desktop":
+        if IS_LINUX and custom_path.suffix.lower() == ".desktop":
             exec_line = _read_desktop_exec_line(str(custom_path))
             command = _apply_desktop_arguments(
                 exec_line=exec_line,
@@ -465,58 +475,59 @@ def _launch_executable_step(
     )
 
 
+def _read_proc_file(path: str) -> bytes:
+    try:
+        with open(path, "rb") as proc_file:
+            return proc_file.read()
+    except OSError:
+        return b""
+
+
 def _linux_process_detected(
     process_name: str | None,
     process_path: str | None,
 ) -> bool:
-    proc_root = Path("/proc")
-
-    if not proc_root.exists():
-        return False
-
     wanted_name = process_name.lower() if process_name else None
     wanted_path = str(Path(process_path).expanduser().resolve()) if process_path else None
 
-    for child in proc_root.iterdir():
-        if not child.name.isdigit():
-            continue
-
-        comm_text = ""
-        exe_path = ""
-        cmdline_text = ""
+    try:
+        proc_entries = os.scandir("/proc")
+    except OSError:
+        return False
 
-        try:
-            comm_text = (child / "comm").read_text(errors="ignore").strip()
-        except OSError:
-            pass
+    with proc_entries:
+        for child in proc_entries:
+            if not child.name.isdigit():
+                continue
 
-        try:
-            exe_path = str((child / "exe").resolve())
-        except OSError:
-            pass
+            if wanted_name:
+                comm_text = _read_proc_file(f"{child.path}/comm").decode(errors="ignore")
 
-        try:
-            raw_cmdline = (child / "cmdline").read_bytes()
-            cmdline_text = raw_cmdline.replace(b"\x00", b" ").decode(errors="ignore")
-        except OSError:
-            pass
+                if comm_text.strip().lower() == wanted_name:
+                    return True
 
-        if wanted_name:
-            lower_comm = comm_text.lower()
-            lower_exe_name = Path(exe_path).name.lower() if exe_path else ""
-            lower_cmdline = cmdline_text.lower()
+            try:
+                exe_path = os.readlink(f"{child.path}/exe")
+            except OSError:
+                exe_path = ""
 
-            if wanted_name in {lower_comm, lower_exe_name}:
+            if wanted_name and exe_path and os.path.basename(exe_path).lower() == wanted_name:
                 return True
 
-            if wanted_name in lower_cmdline:
+            if wanted_path and exe_path == wanted_path:
                 return True
 
-        if wanted_path:
-            if exe_path == wanted_path:
+            raw_cmdline = _read_proc_file(f"{child.path}/cmdline")
+
+            if not raw_cmdline:
+                continue
+
+            cmdline_text = raw_cmdline.replace(b"\x00", b" ").decode(errors="ignore")
+
+            if wanted_name and wanted_name in cmdline_text.lower():
                 return True
 
-            if wanted_path in cmdline_text:
+            if wanted_path and wanted_path in cmdline_text:
                 return True
 
     return False
@@ -580,10 +591,10 @@ def _process_detected(
     process_name: str | None,
     process_path: str | None,
 ) -> bool:
-    if sys.platform.startswith("linux"):
+    if IS_LINUX:
         return _linux_process_detected(process_name, process_path)
 
-    if sys.platform.startswith("win"):
+    if IS_WINDOWS:
         if process_name and _windows_process_detected_by_name(process_name):
             return True
 
@@ -626,10 +637,12 @@ def _wait_for_process_step(step: ProfileStep, dry_run: bool) -> None:
             print("  process detected.")
             return
 
-        if timeout_seconds == 0 or time.monotonic() >= deadline:
+        remaining = deadline - time.monotonic()
+
+        if timeout_seconds == 0 or remaining <= 0:
             break
 
-        time.sleep(1)
+        time.sleep(min(PROCESS_POLL_INTERVAL_SECONDS, remaining))
 
     raise TimeoutError(
         "Timed out waiting for process: "
@@ -731,11 +744,13 @@ def _delay_step(step: ProfileStep, dry_run: bool) -> None:
             print("  process detected. Skipping remaining delay.")
             return
 
-        if step.delay_seconds == 0 or time.monotonic() >= deadline:
+        remaining = deadline - time.monotonic()
+
+        if step.delay_seconds == 0 or remaining <= 0:
             print("  delay completed.")
             return
 
-        time.sleep(1)
+        time.sleep(min(PROCESS_POLL_INTERVAL_SECONDS, remaining))
 
 
 def _open_url_step(step: ProfileStep, dry_run: bool) -> None:
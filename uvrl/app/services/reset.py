@@ -34,6 +34,7 @@ GENERATED_DATA_DIRECTORIES = [
     PROJECT_ROOT / "data" / "test_configs",
     PROJECT_ROOT / "data" / "alternate_variant_exports",
     PROJECT_ROOT / "data" / "alternate_backup_exports",
+    PROJECT_ROOT / "data" / "scan_cache",
 ]
 
 
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+from uvrl.app.services.database import DATA_DIR
+
+
+SCAN_CACHE_DIR = DATA_DIR / "scan_cache"
+SCAN_CACHE_PATH = SCAN_CACHE_DIR / "scan_cache.json"
+
+SCAN_CACHE_VERSION = 2
+
+
+@dataclass(frozen=True, slots=True)
+class ScanCacheRecord:
+    """
+    Cached walk of one scan root.
+
+    Catalog matching only looks at file names and paths, and any file
+    created, removed, or renamed changes its parent directory's mtime.
+    If every walked directory still has its recorded mtime, the walk
+    would find the same files, so only the files that matched the
+    catalog need to be kept.
+    """
+
+    fingerprint: str
+    directory_mtimes: dict[str, int]
+    files_seen: int
+    matched_files: list[tuple[str, str]]
+
+    def to_json(self) -> dict[str, object]:
+        return {
+            "fingerprint": self.fingerprint,
+            "directory_mtimes": self.directory_mtimes,
+            "files_seen": self.files_seen,
+            "matched_files": [list(item) for item in self.matched_files],
+        }
+
+    @classmethod
+    def from_json(cls, data: dict) -> ScanCacheRecord:
+        return cls(
+            fingerprint=str(data["fingerprint"]),
+            directory_mtimes={str(key): int(value) for key, value in data["directory_mtimes"].items()},
+            files_seen=int(data["files_seen"]),
+            matched_files=[(str(path), str(name)) for path, name in data["matched_files"]],
+        )
+
+
+def scan_cache_key(root_text: str, depth: int | None) -> str:
+    depth_text = "full" if depth is None else str(depth)
+    return f"{root_text}|{depth_text}"
+
+
+def scan_cache_fingerprint(*parts: object) -> str:
+    """
+    Hash everything besides the directory tree that affects a root's
+    results, such as the catalog entries and the walk exclusions.
+    """
+    return hashlib.sha256(repr((SCAN_CACHE_VERSION, parts)).encode("utf-8")).hexdigest()
+
+
+def load_scan_cache(cache_path: Path = SCAN_CACHE_PATH) -> dict[str, ScanCacheRecord]:
+    try:
+        data = json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(data, dict) or data.get("version") != SCAN_CACHE_VERSION:
+        return {}
+
+    roots = data.get("roots")
+
+    if not isinstance(roots, dict):
+        return {}
+
+    records: dict[str, ScanCacheRecord] = {}
+
+    for key, record_data in roots.items():
+        try:
+            records[str(key)] = ScanCacheRecord.from_json(record_data)
+        except (AttributeError, KeyError, TypeError, ValueError):
+            continue
+
+    return records
+
+
+def save_scan_cache(
+    records: dict[str, ScanCacheRecord],
+    cache_path: Path = SCAN_CACHE_PATH,
+) -> None:
+    data = {
+        "version": SCAN_CACHE_VERSION,
+        "roots": {key: record.to_json() for key, record in records.items()},
+    }
+
+    temp_path = cache_path.with_name(f"{cache_path.name}.tmp")
+
+    # The cache is only an optimisation, so failing to write it must not
+    # fail the scan.
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+        os.replace(temp_path, cache_path)
+    except OSError:
+        pass
+
+
+def scan_cache_record_is_current(record: ScanCacheRecord, fingerprint: str) -> bool:
+    if record.fingerprint != fingerprint:
+        return False
+
+    for directory, mtime_ns in record.directory_mtimes.items():
+        try:
+            if os.stat(directory).st_mtime_ns != mtime_ns:
+                return False
+        except OSError:
+            return False
+
+    return True
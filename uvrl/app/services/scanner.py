@@ -2,11 +2,25 @@ from __future__ import annotations
 
 import os
 import platform
+import re
+import signal
 import subprocess
-from dataclasses import dataclass
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
+from typing import Callable, Iterable, Iterator
 
 from uvrl.app.services.database import open_database
+from uvrl.app.services.scan_cache import (
+    ScanCacheRecord,
+    load_scan_cache,
+    save_scan_cache,
+    scan_cache_fingerprint,
+    scan_cache_key,
+    scan_cache_record_is_current,
+)
 
 
 LINUX_SCRIPT_EXTENSIONS = {
@@ -58,7 +72,49 @@ NON_EXECUTABLE_APP_SUFFIXES = {
 }
 
 
-@dataclass(frozen=True)
+NON_EXECUTABLE_APP_SUFFIX_PATTERN = re.compile(
+    r"\.(?:"
+    + "|".join(re.escape(suffix[1:]) for suffix in sorted(NON_EXECUTABLE_APP_SUFFIXES))
+    + r")(?=\.|$)",
+    re.IGNORECASE,
+)
+
+
+DESKTOP_EXEC_LINE_PATTERN = re.compile(r"^Exec=(.*)$", re.MULTILINE)
+
+
+# App matches of these types launch by id and carry no executable path, so
+# every file that matches the entry produces the same result.
+ID_LAUNCHED_APP_MATCH_TYPES = frozenset({"steam_app_id", "flatpak_app_id"})
+
+
+MAX_SCAN_WORKERS = 8
+
+
+LINUX_EXCLUDED_SCAN_PATHS = (
+    "/proc",
+    "/sys",
+    "/dev",
+)
+
+
+EXCLUDED_DIR_NAMES = {
+    ".git",
+    ".hg",
+    ".svn",
+    "__pycache__",
+    "node_modules",
+    ".venv",
+    "venv",
+    ".tox",
+    ".nox",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".ruff_cache",
+}
+
+
+@dataclass(frozen=True, slots=True)
 class CatalogEntry:
     discovery_catalog_id: int
     target_kind: str
@@ -75,14 +131,14 @@ class CatalogEntry:
     notes: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScanRoot:
     path: Path
     label: str
     depth: int | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DirectoryStatus:
     path: Path
     ok: bool
@@ -90,7 +146,7 @@ class DirectoryStatus:
     files_seen: int = 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FoundExecutable:
     display_name: str
     platform_name: str
@@ -104,7 +160,7 @@ class FoundExecutable:
     notes: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FoundConfig:
     display_name: str
     platform_name: str
@@ -115,13 +171,22 @@ class FoundConfig:
     notes: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class RootScanResult:
+    executables: list[FoundExecutable] = field(default_factory=list)
+    configs: list[FoundConfig] = field(default_factory=list)
+    statuses: list[DirectoryStatus] = field(default_factory=list)
+    cache_record: ScanCacheRecord | None = None
+
+
+@dataclass(frozen=True, slots=True)
 class ScanResult:
     executables: list[FoundExecutable]
     configs: list[FoundConfig]
     statuses: list[DirectoryStatus]
 
 
+@lru_cache(maxsize=None)
 def detect_uvrl_platform() -> str:
     system_name = platform.system().lower()
 
@@ -187,18 +252,22 @@ def recommended_scan_roots() -> list[ScanRoot]:
     home = Path.home()
 
     if uvrl_platform == "linux":
+        local_share = home / ".local" / "share"
+        steam_apps = local_share / "Steam" / "steamapps"
+        alternate_steam_apps = home / ".steam" / "steam" / "steamapps"
+
         return [
             ScanRoot(Path("/usr/bin"), "System binaries", 0),
             ScanRoot(Path("/usr/local/bin"), "Local system binaries", 0),
             ScanRoot(home / ".local" / "bin", "User local binaries", 1),
-            ScanRoot(home / ".local" / "share" / "applications", "Desktop app entries", 1),
-            ScanRoot(home / ".local" / "share" / "Steam" / "steamapps", "Steam app manifests", 2),
-            ScanRoot(home / ".local" / "share" / "Steam" / "steamapps" / "common", "Steam common apps", 2),
-            ScanRoot(home / ".steam" / "steam" / "steamapps", "Alternate Steam app manifests", 2),
-            ScanRoot(home / ".steam" / "steam" / "steamapps" / "common", "Alternate Steam common apps", 2),
+            ScanRoot(local_share / "applications", "Desktop app entries", 1),
+            ScanRoot(steam_apps, "Steam app manifests", 2),
+            ScanRoot(steam_apps / "common", "Steam common apps", 2),
+            ScanRoot(alternate_steam_apps, "Alternate Steam app manifests", 2),
+            ScanRoot(alternate_steam_apps / "common", "Alternate Steam common apps", 2),
             ScanRoot(home / ".config", "User config directory", 2),
-            ScanRoot(home / ".local" / "share", "User local share", 2),
-            ScanRoot(home / ".local" / "share" / "Steam" / "userdata", "Steam userdata configs", 4),
+            ScanRoot(local_share, "User local share", 2),
+            ScanRoot(local_share / "Steam" / "userdata", "Steam userdata configs", 4),
         ]
 
     if uvrl_platform == "windows":
@@ -217,8 +286,9 @@ def recommended_scan_roots() -> list[ScanRoot]:
             candidates.append(ScanRoot(Path(program_files_x86), "Program Files x86", 3))
 
         if local_app_data:
-            candidates.append(ScanRoot(Path(local_app_data), "Local AppData", 2))
-            candidates.append(ScanRoot(Path(local_app_data) / "Programs", "User local programs", 3))
+            local_app_data_path = Path(local_app_data)
+            candidates.append(ScanRoot(local_app_data_path, "Local AppData", 2))
+            candidates.append(ScanRoot(local_app_data_path / "Programs", "User local programs", 3))
 
         if app_data:
             candidates.append(ScanRoot(Path(app_data), "Roaming AppData", 2))
@@ -332,10 +402,11 @@ def choose_scan_roots_interactively() -> list[ScanRoot]:
     roots: list[ScanRoot] = []
 
     for candidate in recommended_scan_roots():
-        exists_text = "exists" if candidate.path.exists() else "missing"
+        candidate_exists = candidate.path.exists()
+        exists_text = "exists" if candidate_exists else "missing"
         include = _prompt_yes_no(
             f"Include {candidate.label}: {candidate.path} ({exists_text}, depth {_format_depth(candidate.depth)})?",
-            default=candidate.path.exists(),
+            default=candidate_exists,
         )
 
         if include:
@@ -427,20 +498,197 @@ def review_scan_roots_interactively(roots: list[ScanRoot]) -> list[ScanRoot]:
         print("Unknown option.")
 
 
-def _iter_files_limited(root: Path, depth: int | None) -> tuple[list[Path], list[DirectoryStatus]]:
-    files: list[Path] = []
-    statuses: list[DirectoryStatus] = []
+def _excluded_paths_under(root_text: str, uvrl_platform: str) -> frozenset[str]:
+    """
+    Return the excluded system paths that sit below root_text.
+
+    This is worked out once per root so the walk only pays for the check
+    when the root actually contains one of them, such as a scan of / or C:\\.
+    A root chosen inside an excluded path is still scanned.
+    """
+    if uvrl_platform == "linux":
+        candidates: tuple[str, ...] = LINUX_EXCLUDED_SCAN_PATHS
+    elif uvrl_platform == "windows":
+        system_root = os.environ.get("SystemRoot")
+        candidates = (system_root,) if system_root else ()
+    else:
+        candidates = ()
+
+    clean_root = os.path.normcase(os.path.abspath(root_text))
+    excluded: set[str] = set()
+
+    for candidate in candidates:
+        clean_candidate = os.path.normcase(os.path.abspath(candidate))
+
+        try:
+            is_below_root = os.path.commonpath([clean_root, clean_candidate]) == clean_root
+        except ValueError:
+            continue
+
+        if is_below_root and clean_candidate != clean_root:
+            excluded.add(clean_candidate)
+
+    return frozenset(excluded)
+
+
+def _nested_root_paths(root: ScanRoot, roots: list[ScanRoot]) -> frozenset[str]:
+    """
+    Return the other selected roots below root that reach at least as deep
+    as root's own walk would inside them.
+
+    Recommended roots overlap, such as User local share and the Steam
+    directories inside it. Those subtrees are left to the nested root
+    instead of being walked twice.
+    """
+    clean_root = os.path.normcase(os.path.abspath(root.path.expanduser()))
+    nested: set[str] = set()
+
+    for other in roots:
+        clean_other = os.path.normcase(os.path.abspath(other.path.expanduser()))
+
+        if clean_other == clean_root:
+            continue
+
+        try:
+            if os.path.commonpath([clean_root, clean_other]) != clean_root:
+                continue
+        except ValueError:
+            continue
+
+        if other.depth is not None:
+            if root.depth is None:
+                continue
+
+            levels_below = len(os.path.relpath(clean_other, clean_root).split(os.sep))
+
+            if other.depth < root.depth - levels_below:
+                continue
+
+        nested.add(clean_other)
+
+    return frozenset(nested)
+
+
+def _walk_files(
+    root_text: str,
+    depth: int | None,
+    on_error: Callable[[OSError], None],
+    excluded_paths: frozenset[str] = frozenset(),
+    directory_mtimes: dict[str, int] | None = None,
+    stop_walk: threading.Event | None = None,
+) -> Iterator[os.DirEntry[str]]:
+    pending: list[tuple[str, int]] = [(root_text, 0)]
+
+    scandir = os.scandir
+    normcase = os.path.normcase
+    excluded_dir_names = EXCLUDED_DIR_NAMES
+    push_directory = pending.append
+    pop_directory = pending.pop
+    walk_stopped = stop_walk.is_set if stop_walk is not None else None
+
+    while pending:
+        if walk_stopped is not None and walk_stopped():
+            return
+
+        current_dir, current_depth = pop_directory()
+        descend = depth is None or current_depth < depth
+
+        try:
+            with scandir(current_dir) as entries:
+                for entry in entries:
+                    # Every failure is reported through on_error, so a walk that
+                    # skipped anything is marked failed and never cached.
+                    try:
+                        is_directory = entry.is_dir(follow_symlinks=False)
+                    except OSError as error:
+                        on_error(error)
+                        continue
+
+                    if is_directory:
+                        if (
+                            descend
+                            and entry.name.lower() not in excluded_dir_names
+                            and not (
+                                excluded_paths
+                                and normcase(entry.path) in excluded_paths
+                            )
+                        ):
+                            if directory_mtimes is not None:
+                                # Recorded before the directory is listed, so a
+                                # change made during the walk invalidates the cache.
+                                try:
+                                    directory_mtimes[entry.path] = entry.stat(
+                                        follow_symlinks=False
+                                    ).st_mtime_ns
+                                except OSError as error:
+                                    on_error(error)
+                                    continue
+
+                            push_directory((entry.path, current_depth + 1))
+
+                        continue
+
+                    try:
+                        is_file = entry.is_file()
+                    except OSError as error:
+                        on_error(error)
+                        continue
+
+                    if is_file:
+                        yield entry
+        except OSError as error:
+            on_error(error)
+
+
+def _scan_root(
+    root: ScanRoot,
+    catalog_entries: list[CatalogEntry],
+    uvrl_platform: str,
+    cache_fingerprint: str,
+    cached_record: ScanCacheRecord | None = None,
+    nested_root_paths: frozenset[str] = frozenset(),
+    stop_walk: threading.Event | None = None,
+) -> RootScanResult:
+    root_path = root.path.expanduser()
+    root_text = str(root_path)
+
+    if not os.path.isdir(root_text):
+        if not os.path.exists(root_text):
+            return RootScanResult(
+                statuses=[DirectoryStatus(path=root_path, ok=False, message="Path does not exist.")],
+            )
+
+        return RootScanResult(
+            statuses=[DirectoryStatus(path=root_path, ok=False, message="Path is not a directory.")],
+        )
 
-    root = root.expanduser()
+    if cached_record is not None and scan_cache_record_is_current(cached_record, cache_fingerprint):
+        executables, configs = _match_files_against_catalog(
+            files=cached_record.matched_files,
+            root=root,
+            catalog_entries=catalog_entries,
+            uvrl_platform=uvrl_platform,
+        )
 
-    if not root.exists():
-        return files, [DirectoryStatus(path=root, ok=False, message="Path does not exist.")]
+        return RootScanResult(
+            executables=executables,
+            configs=configs,
+            statuses=[
+                DirectoryStatus(
+                    path=root_path,
+                    ok=True,
+                    message="Unchanged since last scan. Used cached results.",
+                    files_seen=cached_record.files_seen,
+                )
+            ],
+            cache_record=cached_record,
+        )
 
-    if not root.is_dir():
-        return files, [DirectoryStatus(path=root, ok=False, message="Path is not a directory.")]
+    statuses: list[DirectoryStatus] = []
+    files_seen = 0
 
     def on_error(error: OSError) -> None:
-        error_path = Path(error.filename) if error.filename else root
+        error_path = Path(error.filename) if error.filename else root_path
         statuses.append(
             DirectoryStatus(
                 path=error_path,
@@ -449,54 +697,72 @@ def _iter_files_limited(root: Path, depth: int | None) -> tuple[list[Path], list
             )
         )
 
+    excluded_paths = _excluded_paths_under(root_text, uvrl_platform) | nested_root_paths
+
     try:
-        for current_dir, dir_names, file_names in os.walk(
-            root,
-            topdown=True,
-            followlinks=False,
-            onerror=on_error,
-        ):
-            current_path = Path(current_dir)
+        directory_mtimes: dict[str, int] = {root_text: os.stat(root_text).st_mtime_ns}
+    except OSError as error:
+        on_error(error)
+        directory_mtimes = {}
 
-            try:
-                relative = current_path.relative_to(root)
-                current_depth = 0 if str(relative) == "." else len(relative.parts)
-            except ValueError:
-                current_depth = 0
+    matched_files: list[tuple[str, str]] = []
 
-            if depth is not None and current_depth >= depth:
-                dir_names[:] = []
+    def iter_files() -> Iterator[tuple[str, str]]:
+        nonlocal files_seen
 
-            for file_name in file_names:
-                files.append(current_path / file_name)
+        for entry in _walk_files(
+            root_text,
+            root.depth,
+            on_error,
+            excluded_paths,
+            directory_mtimes,
+            stop_walk,
+        ):
+            files_seen += 1
+            yield entry.path, entry.name
 
-    except OSError as error:
-        statuses.append(
-            DirectoryStatus(
-                path=root,
-                ok=False,
-                message=f"Search failed: {error}",
-                files_seen=len(files),
-            )
+    executables, configs = _match_files_against_catalog(
+        files=iter_files(),
+        root=root,
+        catalog_entries=catalog_entries,
+        uvrl_platform=uvrl_platform,
+        matched_files=matched_files,
+    )
+
+    cache_record = None
+
+    # Fixing a directory's permissions changes only its ctime, so a walk that
+    # hit errors is never cached.
+    if directory_mtimes and not statuses:
+        cache_record = ScanCacheRecord(
+            fingerprint=cache_fingerprint,
+            directory_mtimes=directory_mtimes,
+            files_seen=files_seen,
+            matched_files=matched_files,
         )
-        return files, statuses
 
     statuses.insert(
         0,
         DirectoryStatus(
-            path=root,
+            path=root_path,
             ok=True,
             message="Searched successfully.",
-            files_seen=len(files),
+            files_seen=files_seen,
         ),
     )
 
-    return files, statuses
+    return RootScanResult(
+        executables=executables,
+        configs=configs,
+        statuses=statuses,
+        cache_record=cache_record,
+    )
 
 
 def _is_linux_executable(path: Path) -> bool:
+    # Callers only pass paths the walk reported as files.
     try:
-        return path.is_file() and os.access(path, os.X_OK)
+        return os.access(path, os.X_OK)
     except OSError:
         return False
 
@@ -516,10 +782,10 @@ def _is_linux_executable_candidate(path: Path, launch_kind: str | None) -> bool:
 
 
 def _is_executable_candidate(path: Path, entry: CatalogEntry, uvrl_platform: str) -> bool:
-    if entry.match_type in {"steam_app_id", "flatpak_app_id"}:
+    if entry.match_type in ID_LAUNCHED_APP_MATCH_TYPES:
         return True
 
-    if any(suffix.lower() in NON_EXECUTABLE_APP_SUFFIXES for suffix in path.suffixes):
+    if NON_EXECUTABLE_APP_SUFFIX_PATTERN.search(path.name.lstrip(".")):
         return False
 
     if uvrl_platform == "windows":
@@ -528,12 +794,11 @@ def _is_executable_candidate(path: Path, entry: CatalogEntry, uvrl_platform: str
     if uvrl_platform == "linux":
         return _is_linux_executable_candidate(path, entry.launch_kind)
 
-    return path.is_file()
+    return True
 
 
-def _matches_steam_app_id(path: Path, steam_app_id: str) -> bool:
-    expected = f"appmanifest_{steam_app_id}.acf"
-    return path.name.lower() == expected.lower()
+def _steam_manifest_name(steam_app_id: str) -> str:
+    return f"appmanifest_{steam_app_id.strip()}.acf"
 
 
 def _normalize_path_text(value: str) -> str:
@@ -541,47 +806,48 @@ def _normalize_path_text(value: str) -> str:
 
 
 def _path_tail_matches(path_text: str, match_value: str) -> bool:
-    clean_path = _normalize_path_text(path_text).rstrip("/")
-    clean_match = _normalize_path_text(match_value).strip("/")
+    # Both arguments are expected to be normalized already.
+    clean_path = path_text.rstrip("/")
+    clean_match = match_value.strip("/")
 
-    return clean_path == clean_match or clean_path.endswith(f"/{clean_match}")
+    if not clean_path.endswith(clean_match):
+        return False
 
+    boundary = len(clean_path) - len(clean_match) - 1
 
-def _matches_catalog_entry(path: Path, entry: CatalogEntry) -> bool:
-    match_value = _normalize_path_text(entry.match_value)
-    filename = path.name.lower()
-    path_text = _normalize_path_text(str(path))
+    return boundary < 0 or clean_path[boundary] == "/"
 
-    if entry.target_kind == "config":
-        if entry.match_type == "filename_exact":
-            return filename == match_value
 
+def _matches_catalog_entry(
+    filename: str,
+    path_text: str,
+    entry: CatalogEntry,
+    match_value: str,
+) -> bool:
+    """
+    Match one of the scanned entries from _index_catalog_entries.
+
+    filename_exact and steam_app_id entries are matched by the index's
+    file name lookup and never reach this function.
+    """
+    if entry.target_kind == "config":
         if entry.match_type == "filename_contains":
             return match_value in filename
 
         if entry.match_type == "path_contains":
             return _path_tail_matches(path_text, match_value)
 
-        if entry.match_type == "steam_app_id":
-            return _matches_steam_app_id(path, entry.match_value)
-
         if entry.match_type == "flatpak_app_id":
             return _path_tail_matches(path_text, match_value)
 
         return False
 
-    if entry.match_type == "filename_exact":
-        return filename == match_value
-
     if entry.match_type == "filename_contains":
         return match_value in filename
 
     if entry.match_type == "path_contains":
         return match_value in path_text
 
-    if entry.match_type == "steam_app_id":
-        return _matches_steam_app_id(path, entry.match_value)
-
     if entry.match_type == "flatpak_app_id":
         return match_value in path_text
 
@@ -647,26 +913,89 @@ def _found_config_from_match(
 
 
 
+def _index_catalog_entries(
+    catalog_entries: list[CatalogEntry],
+) -> tuple[dict[str, list[tuple[int, CatalogEntry]]], list[tuple[int, CatalogEntry, str]]]:
+    """
+    Split catalog entries into exact file name lookups and entries that
+    still need a per-file scan.
+
+    filename_exact and steam_app_id entries only ever match one file name,
+    so they are keyed by that name and found with a single dict lookup.
+    Every match value is normalized once here rather than per file.
+    The catalog index is kept so matches are reported in catalog order.
+    """
+    exact_name_entries: dict[str, list[tuple[int, CatalogEntry]]] = {}
+    scanned_entries: list[tuple[int, CatalogEntry, str]] = []
+
+    for index, entry in enumerate(catalog_entries):
+        match_value = _normalize_path_text(entry.match_value)
+
+        if entry.match_type == "filename_exact":
+            exact_name_entries.setdefault(match_value, []).append((index, entry))
+
+        elif entry.match_type == "steam_app_id":
+            expected = _steam_manifest_name(entry.match_value).lower()
+            exact_name_entries.setdefault(expected, []).append((index, entry))
+
+        else:
+            scanned_entries.append((index, entry, match_value))
+
+    return exact_name_entries, scanned_entries
+
+
 def _match_files_against_catalog(
-    files: list[Path],
+    files: Iterable[tuple[str, str]],
     root: ScanRoot,
     catalog_entries: list[CatalogEntry],
     uvrl_platform: str,
+    matched_files: list[tuple[str, str]] | None = None,
 ) -> tuple[list[FoundExecutable], list[FoundConfig]]:
     executables: list[FoundExecutable] = []
     configs: list[FoundConfig] = []
 
-    for path in files:
-        try:
-            if not path.is_file():
-                continue
-        except OSError:
+    exact_name_entries, scanned_entries = _index_catalog_entries(catalog_entries)
+
+    # A flatpak_app_id entry matches every file under the app's directory.
+    # Once an id-launched entry has produced its result, later files add
+    # nothing, so they are neither rebuilt nor recorded in the scan cache.
+    emitted_entry_indexes: set[int] = set()
+
+    normalize_path_text = _normalize_path_text
+    matches_catalog_entry = _matches_catalog_entry
+    exact_matches_for = exact_name_entries.get
+
+    for file_path_text, file_name in files:
+        filename = file_name.lower()
+        path_text = normalize_path_text(file_path_text)
+
+        matched_entries = [
+            (index, entry)
+            for index, entry, match_value in scanned_entries
+            if matches_catalog_entry(filename, path_text, entry, match_value)
+        ]
+        exact_matches = exact_matches_for(filename)
+
+        if exact_matches:
+            matched_entries.extend(exact_matches)
+            matched_entries.sort(key=lambda item: item[0])
+
+        if emitted_entry_indexes:
+            matched_entries = [
+                (index, entry)
+                for index, entry in matched_entries
+                if index not in emitted_entry_indexes
+            ]
+
+        if not matched_entries:
             continue
 
-        for entry in catalog_entries:
-            if not _matches_catalog_entry(path, entry):
-                continue
+        if matched_files is not None:
+            matched_files.append((file_path_text, file_name))
 
+        path = Path(file_path_text)
+
+        for index, entry in matched_entries:
             if entry.target_kind == "app":
                 found = _found_executable_from_match(
                     path=path,
@@ -678,6 +1007,9 @@ def _match_files_against_catalog(
                 if found is not None:
                     executables.append(found)
 
+                    if entry.match_type in ID_LAUNCHED_APP_MATCH_TYPES:
+                        emitted_entry_indexes.add(index)
+
             elif entry.target_kind == "config":
                 configs.append(
                     _found_config_from_match(
@@ -715,26 +1047,27 @@ def _list_installed_flatpak_app_ids() -> set[str]:
     }
 
 
-def _flatpak_desktop_file_candidates(app_id: str) -> list[Path]:
-    return [
-        Path.home() / ".local" / "share" / "flatpak" / "exports" / "share" / "applications" / f"{app_id}.desktop",
-        Path("/var/lib/flatpak/exports/share/applications") / f"{app_id}.desktop",
-        Path.home() / ".local" / "share" / "applications" / f"{app_id}.desktop",
-    ]
+def _flatpak_desktop_file_candidates(app_id: str) -> Iterator[Path]:
+    desktop_file_name = f"{app_id}.desktop"
+    local_share = Path.home() / ".local" / "share"
+
+    yield local_share / "flatpak" / "exports" / "share" / "applications" / desktop_file_name
+    yield Path("/var/lib/flatpak/exports/share/applications") / desktop_file_name
+    yield local_share / "applications" / desktop_file_name
 
 
 def _read_flatpak_exec_line(app_id: str) -> str | None:
     for desktop_file in _flatpak_desktop_file_candidates(app_id):
-        if not desktop_file.exists():
-            continue
-
         try:
-            for line in desktop_file.read_text(errors="ignore").splitlines():
-                if line.startswith("Exec="):
-                    return line.removeprefix("Exec=").strip()
+            content = desktop_file.read_text(errors="ignore")
         except OSError:
             continue
 
+        match = DESKTOP_EXEC_LINE_PATTERN.search(content)
+
+        if match is not None:
+            return match.group(1).strip()
+
     return None
 
 
@@ -758,22 +1091,25 @@ def _discover_flatpak_apps_from_catalog(
     if uvrl_platform != "linux":
         return []
 
-    installed_app_ids = _list_installed_flatpak_app_ids()
+    catalog_apps = [
+        (entry, entry.flatpak_app_id or entry.match_value)
+        for entry in catalog_entries
+        if entry.target_kind == "app" and entry.match_type == "flatpak_app_id"
+    ]
 
-    if not installed_app_ids:
+    if not catalog_apps:
         return []
 
-    found: list[FoundExecutable] = []
-
-    for entry in catalog_entries:
-        if entry.target_kind != "app":
-            continue
+    installed_app_ids = _list_installed_flatpak_app_ids().intersection(
+        app_id for _, app_id in catalog_apps
+    )
 
-        if entry.match_type != "flatpak_app_id":
-            continue
+    if not installed_app_ids:
+        return []
 
-        app_id = entry.flatpak_app_id or entry.match_value
+    found: list[FoundExecutable] = []
 
+    for entry, app_id in catalog_apps:
         if app_id not in installed_app_ids:
             continue
 
@@ -794,21 +1130,119 @@ def _discover_flatpak_apps_from_catalog(
     return found
 
 
-def scan_roots(roots: list[ScanRoot]) -> ScanResult:
+def _resolved_path_text(path: Path | None, resolved_paths: dict[str, str]) -> str | None:
+    if path is None:
+        return None
+
+    path_text = str(path)
+    resolved = resolved_paths.get(path_text)
+
+    if resolved is None:
+        try:
+            resolved = str(path.resolve())
+        except OSError:
+            resolved = path_text
+
+        resolved_paths[path_text] = resolved
+
+    return resolved
+
+
+def scan_roots(
+    roots: list[ScanRoot],
+    catalog_entries: list[CatalogEntry] | None = None,
+    use_cache: bool = True,
+    flatpak_apps: Future[list[FoundExecutable]] | None = None,
+) -> ScanResult:
     uvrl_platform = detect_uvrl_platform()
-    catalog_entries = load_enabled_catalog_entries()
 
-    all_executables: list[FoundExecutable] = _discover_flatpak_apps_from_catalog(
-        catalog_entries=catalog_entries,
-        uvrl_platform=uvrl_platform,
+    if catalog_entries is None:
+        catalog_entries = load_enabled_catalog_entries()
+
+    scan_cache = load_scan_cache()
+    cache_fingerprint = scan_cache_fingerprint(
+        catalog_entries,
+        sorted(EXCLUDED_DIR_NAMES),
+        uvrl_platform,
     )
+
+    stop_walk = threading.Event()
+
+    def root_cache_key(root: ScanRoot) -> str:
+        return scan_cache_key(str(root.path.expanduser()), root.depth)
+
+    def scan_one_root(root: ScanRoot) -> RootScanResult:
+        nested_root_paths = _nested_root_paths(root, roots)
+        root_fingerprint = cache_fingerprint
+
+        if nested_root_paths:
+            # Which subtrees were skipped changes what the walk finds.
+            root_fingerprint = scan_cache_fingerprint(cache_fingerprint, sorted(nested_root_paths))
+
+        return _scan_root(
+            root,
+            catalog_entries,
+            uvrl_platform,
+            root_fingerprint,
+            scan_cache.get(root_cache_key(root)) if use_cache else None,
+            nested_root_paths,
+            stop_walk,
+        )
+
+    worker_count = len(roots) + (1 if flatpak_apps is None else 0)
+    max_workers = max(1, min(worker_count, MAX_SCAN_WORKERS))
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    # While the pool runs, the first Ctrl+C asks the walks to stop between
+    # directories. A second one returns without waiting for them; a listing
+    # already in progress still finishes before the process can exit.
+    def request_stop(signum: int, frame: object) -> None:
+        if stop_walk.is_set():
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise KeyboardInterrupt
+
+        stop_walk.set()
+        print()
+        print("Stopping scan. Press Ctrl+C again to stop without waiting.")
+
+    previous_sigint_handler = None
+    handles_sigint = threading.current_thread() is threading.main_thread()
+
+    if handles_sigint:
+        previous_sigint_handler = signal.signal(signal.SIGINT, request_stop)
+
+    try:
+        flatpak_future = flatpak_apps or executor.submit(
+            _discover_flatpak_apps_from_catalog,
+            catalog_entries=catalog_entries,
+            uvrl_platform=uvrl_platform,
+        )
+
+        # Roots are walked concurrently, but map() keeps results in root order
+        # so de-duplication below still prefers the earliest root.
+        root_results = list(executor.map(scan_one_root, roots))
+
+        all_executables: list[FoundExecutable] = flatpak_future.result()
+    finally:
+        if handles_sigint:
+            signal.signal(signal.SIGINT, previous_sigint_handler or signal.SIG_DFL)
+
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    # Stopped walks are incomplete, so they must not reach the scan cache.
+    if stop_walk.is_set():
+        raise KeyboardInterrupt
+
     all_configs: list[FoundConfig] = []
     all_statuses: list[DirectoryStatus] = []
 
     seen_executables: set[tuple[str, str | None, str | None, str | None]] = set()
 
+    resolved_paths: dict[str, str] = {}
+
     for executable in all_executables:
-        executable_path = str(executable.executable_path.resolve()) if executable.executable_path else None
+        executable_path = _resolved_path_text(executable.executable_path, resolved_paths)
         seen_executables.add(
             (
                 executable.display_name,
@@ -820,22 +1254,19 @@ def scan_roots(roots: list[ScanRoot]) -> ScanResult:
 
     seen_configs: set[str] = set()
 
-    for root in roots:
-        files, statuses = _iter_files_limited(root.path, root.depth)
-        all_statuses.extend(statuses)
+    for root, root_result in zip(roots, root_results):
+        if root_result.cache_record is not None:
+            scan_cache[root_cache_key(root)] = root_result.cache_record
+        else:
+            scan_cache.pop(root_cache_key(root), None)
 
-        if not any(status.ok for status in statuses):
-            continue
+    save_scan_cache(scan_cache)
 
-        executables, configs = _match_files_against_catalog(
-            files=files,
-            root=root,
-            catalog_entries=catalog_entries,
-            uvrl_platform=uvrl_platform,
-        )
+    for root_result in root_results:
+        all_statuses.extend(root_result.statuses)
 
-        for executable in executables:
-            executable_path = str(executable.executable_path.resolve()) if executable.executable_path else None
+        for executable in root_result.executables:
+            executable_path = _resolved_path_text(executable.executable_path, resolved_paths)
             key = (
                 executable.display_name,
                 executable_path,
@@ -849,11 +1280,8 @@ def scan_roots(roots: list[ScanRoot]) -> ScanResult:
             seen_executables.add(key)
             all_executables.append(executable)
 
-        for config in configs:
-            try:
-                key = str(config.file_path.resolve())
-            except OSError:
-                key = str(config.file_path)
+        for config in root_result.configs:
+            key = _resolved_path_text(config.file_path, resolved_paths)
 
             if key in seen_configs:
                 continue
@@ -871,62 +1299,79 @@ def scan_roots(roots: list[ScanRoot]) -> ScanResult:
     )
 
 
+def _print_lines(lines: list[str]) -> None:
+    print("\n".join(lines))
+
+
 def _print_statuses(statuses: list[DirectoryStatus]) -> None:
-    print()
-    print("Directory search status:")
+    lines = ["", "Directory search status:"]
 
     for status in statuses:
         prefix = "OK" if status.ok else "FAILED"
-        print(f"  {prefix}: {status.path}")
-        print(f"    {status.message}")
-        print(f"    files seen: {status.files_seen}")
+        lines.append(f"  {prefix}: {status.path}")
+        lines.append(f"    {status.message}")
+        lines.append(f"    files seen: {status.files_seen}")
 
+    _print_lines(lines)
+
+
+def _print_status_summary(statuses: list[DirectoryStatus]) -> None:
+    searched = sum(1 for status in statuses if status.ok)
+    failed = len(statuses) - searched
+    files_seen = sum(status.files_seen for status in statuses)
 
-def _print_executables(executables: list[FoundExecutable]) -> None:
     print()
-    print("Catalog-matched executables:")
+    print(
+        f"Searched {searched} directories, {files_seen} files seen, {failed} failed. "
+        "Choose s to show directory status."
+    )
+
+
+def _print_executables(executables: list[FoundExecutable]) -> None:
+    lines = ["", "Catalog-matched executables:"]
 
     if not executables:
-        print("  none")
-        return
+        lines.append("  none")
 
     for index, executable in enumerate(executables, start=1):
-        print(
+        lines.append(
             f"  [{index}] {executable.display_name} "
             f"({executable.launch_kind}, {executable.platform_name})"
         )
 
         if executable.catalog_id is not None:
-            print(f"      catalog: {executable.catalog_id}")
+            lines.append(f"      catalog: {executable.catalog_id}")
 
         if executable.executable_path is not None:
-            print(f"      path:    {executable.executable_path}")
+            lines.append(f"      path:    {executable.executable_path}")
 
         if executable.steam_app_id:
-            print(f"      steam:   {executable.steam_app_id}")
+            lines.append(f"      steam:   {executable.steam_app_id}")
 
         if executable.flatpak_app_id:
-            print(f"      flatpak: {executable.flatpak_app_id}")
+            lines.append(f"      flatpak: {executable.flatpak_app_id}")
 
         if executable.default_arguments:
-            print(f"      args:    {executable.default_arguments}")
+            lines.append(f"      args:    {executable.default_arguments}")
+
+    _print_lines(lines)
 
 
 def _print_configs(configs: list[FoundConfig]) -> None:
-    print()
-    print("Catalog-matched configs:")
+    lines = ["", "Catalog-matched configs:"]
 
     if not configs:
-        print("  none")
-        return
+        lines.append("  none")
 
     for index, config in enumerate(configs, start=1):
-        print(f"  [{index}] {config.display_name} ({config.file_kind}, {config.platform_name})")
+        lines.append(f"  [{index}] {config.display_name} ({config.file_kind}, {config.platform_name})")
 
         if config.catalog_id is not None:
-            print(f"      catalog: {config.catalog_id}")
+            lines.append(f"      catalog: {config.catalog_id}")
 
-        print(f"      path:    {config.file_path}")
+        lines.append(f"      path:    {config.file_path}")
+
+    _print_lines(lines)
 
 
 def _parse_number_list(text: str, max_value: int) -> set[int]:
@@ -1000,12 +1445,18 @@ def _manual_config_from_prompt() -> FoundConfig | None:
 
 def review_found_results_interactively(
     result: ScanResult,
+    show_statuses: bool = False,
+    quiet: bool = False,
 ) -> tuple[list[FoundExecutable], list[FoundConfig]]:
     executables = list(result.executables)
     configs = list(result.configs)
 
     while True:
-        _print_statuses(result.statuses)
+        if show_statuses:
+            _print_statuses(result.statuses)
+        elif not quiet:
+            _print_status_summary(result.statuses)
+
         _print_executables(executables)
         _print_configs(configs)
 
@@ -1016,6 +1467,7 @@ def review_found_results_interactively(
         print("  rc = remove configs")
         print("  ae = add executable manually")
         print("  ac = add config manually")
+        print("  s = show directory status")
         print("  q = quit without saving")
 
         choice = input("Choose: ").strip().lower()
@@ -1023,6 +1475,11 @@ def review_found_results_interactively(
         if choice == "c":
             return executables, configs
 
+        if choice == "s":
+            _print_statuses(result.statuses)
+            input("Press Enter to continue.")
+            continue
+
         if choice == "q":
             return [], []
 
@@ -1175,28 +1632,55 @@ def save_confirmed_scan_results(
     print(f"  configs skipped as duplicates: {skipped_configs}")
 
 
-def run_scan_wizard() -> None:
+def run_scan_wizard(
+    show_statuses: bool = False,
+    use_cache: bool = True,
+    quiet: bool = False,
+) -> None:
     catalog_entries = load_enabled_catalog_entries()
 
     if not catalog_entries:
         print("No enabled discovery catalog entries found.")
         return
 
-    print(f"Loaded {len(catalog_entries)} enabled discovery catalog entries.")
-    print("Scanner will only show files matching the catalog.")
-    print()
+    if not quiet:
+        print(f"Loaded {len(catalog_entries)} enabled discovery catalog entries.")
+        print("Scanner will only show files matching the catalog.")
+        print()
 
-    roots = choose_scan_roots_interactively()
+    prefetch_executor = ThreadPoolExecutor(max_workers=1)
 
-    if not roots:
-        print("Scan cancelled. No directories selected.")
-        return
+    try:
+        flatpak_apps = prefetch_executor.submit(
+            _discover_flatpak_apps_from_catalog,
+            catalog_entries=catalog_entries,
+            uvrl_platform=detect_uvrl_platform(),
+        )
 
-    print()
-    print("Scanning. This may take a moment.")
-    result = scan_roots(roots)
+        roots = choose_scan_roots_interactively()
 
-    executables, configs = review_found_results_interactively(result)
+        if not roots:
+            print("Scan cancelled. No directories selected.")
+            return
+
+        if not quiet:
+            print()
+            print("Scanning. This may take a moment.")
+
+        result = scan_roots(
+            roots,
+            catalog_entries=catalog_entries,
+            use_cache=use_cache,
+            flatpak_apps=flatpak_apps,
+        )
+    finally:
+        prefetch_executor.shutdown(wait=False, cancel_futures=True)
+
+    executables, configs = review_found_results_interactively(
+        result,
+        show_statuses=show_statuses,
+        quiet=quiet,
+    )
 
     if not executables and not configs:
         print("No confirmed results to save.")